@@ -78,6 +78,16 @@ class TestDetectDominantFormat:
         assert ic.detect_dominant_format([]) == "jpeg"
 
 
+class TestFindImagesFromPaths:
+    def test_requires_real_extension(self, tmp_path):
+        (tmp_path / "real.jpg").write_bytes(b"x")
+        (tmp_path / "photo.JPG").write_bytes(b"xx")   # mixed case still matches
+        (tmp_path / "jpg").write_bytes(b"x")          # extensionless
+        (tmp_path / ".jpg").write_bytes(b"x")         # dotfile, Path.suffix == ''
+        found = {p.name for p, _ in ic.find_images_from_paths([tmp_path])}
+        assert found == {"real.jpg", "photo.JPG"}
+
+
 # ── Duplicate detection (two-stage) ──────────────────────────────────────────
 
 class TestBuildDuplicateSet:
@@ -169,6 +179,41 @@ class TestProcessImage:
         assert out.exists(), "skipped file must still be written to output"
         assert res.output_bytes > 0
 
+    def test_resize_copies_exif_verbatim_by_default(self, tmp_path):
+        # Default path: the EXIF blob passes through untouched, so the pixel
+        # dimension tags keep their (now stale) pre-resize values.
+        import piexif
+        src = tmp_path / "src.jpg"
+        _make_image(src, size=(4000, 2000))
+        exif_dict = {"Exif": {piexif.ExifIFD.PixelXDimension: 4000,
+                              piexif.ExifIFD.PixelYDimension: 2000}}
+        piexif.insert(piexif.dump(exif_dict), str(src))
+
+        out = tmp_path / "out.jpg"
+        res = ic.process_image(str(src), str(out), "jpeg", 85, 2000)
+        assert res.error is None
+        assert res.resized is True
+        loaded = piexif.load(str(out))
+        assert loaded["Exif"][piexif.ExifIFD.PixelXDimension] == 4000
+        assert loaded["Exif"][piexif.ExifIFD.PixelYDimension] == 2000
+
+    def test_patch_exif_dims_rewrites_dimensions(self, tmp_path):
+        import piexif
+        src = tmp_path / "src.jpg"
+        _make_image(src, size=(4000, 2000))
+        exif_dict = {"Exif": {piexif.ExifIFD.PixelXDimension: 4000,
+                              piexif.ExifIFD.PixelYDimension: 2000}}
+        piexif.insert(piexif.dump(exif_dict), str(src))
+
+        out = tmp_path / "out.jpg"
+        res = ic.process_image(str(src), str(out), "jpeg", 85, 2000,
+                               patch_exif_dims=True)
+        assert res.error is None
+        assert res.resized is True
+        loaded = piexif.load(str(out))
+        assert loaded["Exif"][piexif.ExifIFD.PixelXDimension] == 2000
+        assert loaded["Exif"][piexif.ExifIFD.PixelYDimension] == 1000
+
     def test_strip_removes_exif(self, tmp_path):
         # Build a jpeg carrying an EXIF orientation tag, then strip it.
         import piexif
@@ -199,6 +244,24 @@ class TestProcessImage:
             assert im.size == (300, 400), "orientation must be baked into pixels"
 
 
+# ── process_image_batch ──────────────────────────────────────────────────────
+
+class TestProcessImageBatch:
+    def test_results_in_batch_order(self, tmp_path):
+        batch = []
+        for i in range(3):
+            src = tmp_path / f"src{i}.png"
+            _make_image(src, size=(100 + i, 100))
+            batch.append((str(src), str(tmp_path / f"out{i}.jpg"), 0))
+        results = ic.process_image_batch(batch, "jpeg", 85, 3000)
+        assert [r.input for r in results] == [b[0] for b in batch]
+        assert all(r.error is None for r in results)
+        assert all(Path(b[1]).exists() for b in batch)
+
+    def test_empty_batch(self):
+        assert ic.process_image_batch([], "jpeg", 85, 3000) == []
+
+
 # ── CLI integration: rename numbering has no gaps around dupes ────────────────
 
 class TestRenameNumbering:
@@ -253,6 +316,48 @@ class TestReplaceMode:
             assert im.size == (2000, 500)
 
 
+class TestPatchExifDimsFlag:
+    def _run(self, *args):
+        return subprocess.run(
+            [sys.executable, str(REPO_ROOT / "imgcrunch.py"), *args],
+            capture_output=True, text=True, timeout=120,
+        )
+
+    def test_flag_wires_through_to_workers(self, tmp_path):
+        import piexif
+        src = tmp_path / "a.jpg"
+        Image.new("RGB", (4000, 2000), (1, 2, 3)).save(src)
+        exif_dict = {"Exif": {piexif.ExifIFD.PixelXDimension: 4000,
+                              piexif.ExifIFD.PixelYDimension: 2000}}
+        piexif.insert(piexif.dump(exif_dict), str(src))
+
+        r = self._run(str(tmp_path), "-f", "jpeg", "-m", "2000", "--no-move",
+                      "--patch-exif-dims")
+        assert r.returncode == 0, r.stderr
+        loaded = piexif.load(str(tmp_path / "converted" / "a.jpg"))
+        assert loaded["Exif"][piexif.ExifIFD.PixelXDimension] == 2000
+        assert loaded["Exif"][piexif.ExifIFD.PixelYDimension] == 1000
+
+
+class TestEmptyTaskList:
+    def _run(self, *args):
+        return subprocess.run(
+            [sys.executable, str(REPO_ROOT / "imgcrunch.py"), *args],
+            capture_output=True, text=True, timeout=120,
+        )
+
+    def test_all_outputs_resolve_to_inputs(self, tmp_path):
+        # -o pointing at the input dir with -f original makes every output
+        # path equal its input, so the task list ends up empty. Must finish
+        # cleanly with the summary, not crash on zero chunks.
+        src = tmp_path / "a.jpg"
+        Image.new("RGB", (100, 100), (5, 5, 5)).save(src)
+        r = self._run(str(tmp_path), "-o", str(tmp_path), "-f", "original",
+                      "--no-move")
+        assert r.returncode == 0, r.stderr
+        assert src.exists()
+
+
 class TestDryRun:
     def _run(self, *args):
         return subprocess.run(